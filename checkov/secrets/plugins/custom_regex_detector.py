@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from typing import Set, Any, Generator, Pattern, Optional, Dict, Tuple, List, TYPE_CHECKING
+import os
+import sys
+import tempfile
+import threading
+from bisect import bisect_right
+from collections import defaultdict
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Set, Any, Generator, Iterable, NamedTuple, Pattern, Optional, Dict, Tuple, List, TYPE_CHECKING
 
 import yaml
 from detect_secrets.constants import VerifiedResult
@@ -12,9 +23,321 @@ import re
 
 from checkov.common.bridgecrew.platform_integration import bc_integration
 
+try:
+    from re import _parser as sre_parse  # type:ignore[attr-defined]
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 if TYPE_CHECKING:
     from detect_secrets.util.code_snippet import CodeSnippet
 
+# the C implementation of the safe loader parses several times faster, when libyaml is available
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class _CompiledDetectors(NamedTuple):
+    denylist: Tuple[Pattern[str], ...]
+    regex_to_metadata: Dict[Pattern[str], List[Dict[str, Any]]]
+    patterns: Tuple[Pattern[str], ...]
+    combined: Optional[Pattern[str]]
+    gated_patterns: Tuple[Pattern[str], ...]
+    ungated_patterns: Tuple[Pattern[str], ...]
+    hs_db: Optional[Any]
+    prefilter: Optional[Pattern[str]]
+    fast_meta: Dict[Pattern[str], Tuple[Tuple[str, str], ...]]
+
+
+def _compile_regex(pattern: str, flags: int = 0) -> Pattern[str]:
+    """Compiles a detector pattern, preferring google-re2 when it is installed.
+
+    RE2 matches in guaranteed linear time, so a pathological custom policy regex (e.g. `(a+)+$`)
+    cannot stall the scan through catastrophic backtracking. Patterns using constructs RE2 rejects,
+    such as backreferences, fall back to stdlib `re` and keep their original behaviour.
+    """
+    if re2 is not None:
+        try:
+            # re2.compile does not take stdlib flag ints, so MULTILINE is spelled inline instead
+            return re2.compile(f"(?m){pattern}" if flags & re.MULTILINE else pattern)  # type:ignore[no-any-return]
+        except Exception as e:
+            logging.debug(f"Pattern {pattern} is not supported by re2, falling back to re, error: {e}")
+    return re.compile(pattern, flags)
+
+
+def _tokens_have_backreference(tokens: Any) -> bool:
+    for opcode, argument in tokens:
+        if opcode in (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS):
+            return True
+        stack = [argument]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, sre_parse.SubPattern):
+                if _tokens_have_backreference(item):
+                    return True
+            elif isinstance(item, (tuple, list)):
+                stack.extend(item)
+    return False
+
+
+def _has_backreference(pattern: str) -> bool:
+    """Tells whether a pattern uses backreferences, which group renumbering in a fused pattern breaks."""
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        # cannot prove it is safe to fuse, keep it on the per-pattern path
+        return True
+    return _tokens_have_backreference(parsed)
+
+
+def _combine_patterns(patterns: List[Pattern[str]]) -> Optional[Pattern[str]]:
+    """Fuses all detector patterns into a single alternation, used as a has-any-candidate gate.
+
+    The fused pattern only decides in one engine pass whether a buffer contains any candidate at
+    all; matches are always extracted with each pattern's own finditer, because finditer over an
+    alternation reports just the leftmost-first alternative and would drop overlapping or
+    same-position findings of other detectors. Patterns that cannot be combined (e.g. colliding
+    named groups) keep the ungated per-pattern scanning path.
+    """
+    if not patterns:
+        return None
+    parts = [f"(?:{pattern.pattern})" for pattern in patterns]
+    try:
+        # MULTILINE keeps the per-line meaning of ^/$ when a whole file buffer is scanned at once
+        return _compile_regex("|".join(parts), re.MULTILINE)
+    except re.error as e:
+        logging.warning(f"Failed to combine the custom detector regexes into one pattern, "
+                        f"falling back to per-pattern scanning, error: {e}")
+        return None
+
+
+_HS_CACHE_DIR = Path.home() / ".cache" / "checkov"
+
+
+def _load_cached_hyperscan_db(cache_path: Path) -> Optional[Any]:
+    if not cache_path.exists():
+        return None
+    try:
+        # scratch space is not serialized; each scanning thread allocates its own at scan time
+        return hyperscan.loadb(cache_path.read_bytes())
+    except Exception as e:
+        logging.info(f"Failed to load the cached hyperscan database from {cache_path}, "
+                     f"recompiling, error: {e}")
+        return None
+
+
+def _save_hyperscan_db(db: Any, cache_path: Path) -> None:
+    try:
+        serialized = hyperscan.dumpb(db)
+        _HS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=_HS_CACHE_DIR, delete=False) as temp_file:
+            temp_file.write(serialized)
+        # atomic rename, so concurrent checkov runs never observe a partial file
+        os.replace(temp_file.name, cache_path)
+    except Exception as e:
+        logging.info(f"Failed to cache the hyperscan database at {cache_path}, error: {e}")
+
+
+def _build_hyperscan_db(patterns: List[Pattern[str]]) -> Optional[Any]:
+    """Compiles all detector patterns into a Hyperscan block-mode database, if hyperscan is available.
+
+    Hyperscan scans all patterns in one SIMD-accelerated pass over the input, so it is used as a
+    prefilter telling which detectors hit a line; the actual matches are then extracted with the
+    matching detectors' `re` patterns, which keeps capture-group semantics intact. Database
+    compilation is all-or-nothing: if the Hyperscan compiler rejects any pattern (e.g. a
+    backreference), no database is built and every detector keeps the pure-Python scanning path.
+
+    The compiled automaton is persisted under ~/.cache/checkov keyed by a hash of the pattern set,
+    so subsequent CLI invocations skip the DFA construction entirely.
+    """
+    if hyperscan is None or not patterns:
+        return None
+    digest = hashlib.sha256("\x00".join(pattern.pattern for pattern in patterns).encode()).hexdigest()
+    cache_path = _HS_CACHE_DIR / f"hs_db_{digest}.db"
+    db = _load_cached_hyperscan_db(cache_path)
+    if db is not None:
+        return db
+    try:
+        db = hyperscan.Database()
+        # UCP keeps \w/\d/\s Unicode-aware like the `re` extraction pass, so the prefilter never
+        # drops a match the extraction pass would have found
+        flags = (hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                 | hyperscan.HS_FLAG_ALLOWEMPTY | hyperscan.HS_FLAG_MULTILINE)
+        db.compile(
+            expressions=[pattern.pattern.encode() for pattern in patterns],
+            ids=list(range(len(patterns))),
+            flags=[flags] * len(patterns),
+        )
+    except Exception as e:
+        logging.info(f"Failed to compile the custom detector regexes into a hyperscan database, "
+                     f"falling back to pure-Python scanning, error: {e}")
+        return None
+    _save_hyperscan_db(db, cache_path)
+    return db
+
+
+_MAX_PREFILTER_CHARS = 128
+
+
+def _token_first_chars(tokens: Any) -> Optional[Tuple[Set[str], bool]]:
+    """Computes the possible first characters of a parsed regex token sequence.
+
+    Returns (first character set, can the sequence match empty) or None when the tokens contain a
+    construct whose first characters cannot be enumerated (e.g. `.`, negated classes, `\\w`).
+    """
+    first: Set[str] = set()
+    for opcode, argument in tokens:
+        if opcode is sre_parse.LITERAL:
+            first.add(chr(argument))
+            return first, False
+        if opcode is sre_parse.IN:
+            for item_opcode, item_argument in argument:
+                if item_opcode is sre_parse.LITERAL:
+                    first.add(chr(item_argument))
+                elif item_opcode is sre_parse.RANGE:
+                    low, high = item_argument
+                    if high - low >= _MAX_PREFILTER_CHARS:
+                        return None
+                    first.update(chr(point) for point in range(low, high + 1))
+                else:  # NEGATE, CATEGORY, ...
+                    return None
+            return first, False
+        if opcode is sre_parse.BRANCH:
+            can_be_empty = False
+            for branch in argument[1]:
+                branch_first = _token_first_chars(branch)
+                if branch_first is None:
+                    return None
+                first.update(branch_first[0])
+                can_be_empty = can_be_empty or branch_first[1]
+            if not can_be_empty:
+                return first, False
+            continue
+        if opcode is sre_parse.SUBPATTERN:
+            if argument[1] or argument[2]:  # inline flag additions/removals
+                return None
+            sub_first = _token_first_chars(argument[3])
+            if sub_first is None:
+                return None
+            first.update(sub_first[0])
+            if not sub_first[1]:
+                return first, False
+            continue
+        if opcode in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            minimum, _, sub_tokens = argument
+            sub_first = _token_first_chars(sub_tokens)
+            if sub_first is None:
+                return None
+            first.update(sub_first[0])
+            if minimum and not sub_first[1]:
+                return first, False
+            continue
+        if opcode is sre_parse.AT:
+            # zero-width anchor, the first character comes from what follows
+            continue
+        return None
+    return first, True
+
+
+def _pattern_required_chars(pattern: str) -> Optional[Set[str]]:
+    """Returns a character set of which at least one must appear for the pattern to match, or None."""
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+    state = getattr(parsed, 'state', None) or getattr(parsed, 'pattern', None)
+    if state is not None and state.flags & re.IGNORECASE:
+        return None
+    first = _token_first_chars(parsed)
+    if first is None or first[1] or not first[0]:
+        return None
+    return first[0]
+
+
+def _build_prefilter(pattern_sources: Iterable[str]) -> Optional[Pattern[str]]:
+    """Builds a single character-class regex matching any possible first character of any detector.
+
+    A line without a hit for this class cannot match any detector, so the scan can skip it after
+    one cheap C-level pass. When any pattern's first characters cannot be enumerated the prefilter
+    is disabled and every line is scanned.
+    """
+    required: Set[str] = set()
+    for source in pattern_sources:
+        chars = _pattern_required_chars(source)
+        if chars is None:
+            return None
+        required.update(chars)
+        if len(required) > _MAX_PREFILTER_CHARS:
+            # not selective enough to be worth the extra pass
+            return None
+    if not required:
+        return None
+    return re.compile("[{}]".format("".join(re.escape(char) for char in sorted(required))))
+
+
+@lru_cache(maxsize=8)
+def _build_compiled(detectors_key: Tuple[Tuple[str, str, str], ...]) -> _CompiledDetectors:
+    """Builds the compiled pattern tables for a detector set, shared across detector instances.
+
+    Keyed by the (Regex, Name, Check_ID) signature of the loaded detectors, so repeated
+    CustomRegexDetector constructions (the scanning pipeline creates one per file/worker) reuse the
+    same immutable compiled state instead of re-running pattern compilation every time.
+    """
+    # customer policies frequently repeat the same regex under different check IDs; grouping by the
+    # pattern source compiles and scans each unique pattern only once
+    by_regex: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for regex, name, check_id in detectors_key:
+        by_regex[regex].append({'Name': name, 'Check_ID': check_id, 'Regex': regex})
+    regex_to_metadata: Dict[Pattern[str], List[Dict[str, Any]]] = {}
+    patterns: List[Pattern[str]] = []
+    for regex, metadata in by_regex.items():
+        compiled = _compile_regex(regex, re.MULTILINE)
+        # keyed by the compiled pattern itself, which hashes by identity instead of re-hashing the
+        # potentially long pattern source string on every match
+        regex_to_metadata[compiled] = metadata
+        patterns.append(compiled)
+    # an order-preserving tuple; tuples iterate over a contiguous array, which is both faster and
+    # deterministic compared to walking a hash table
+    denylist = tuple(patterns)
+    # backreferences would be renumbered inside the fused pattern and silently never match, so such
+    # patterns stay outside the gate and are always scanned individually
+    fusable: List[Pattern[str]] = []
+    unfusable: List[Pattern[str]] = []
+    for pattern in patterns:
+        if _has_backreference(pattern.pattern):
+            unfusable.append(pattern)
+        else:
+            fusable.append(pattern)
+    combined = _combine_patterns(fusable)
+    gated_patterns = tuple(fusable) if combined is not None else ()
+    ungated_patterns = tuple(unfusable) if combined is not None else denylist
+    hs_db = _build_hyperscan_db(patterns)
+    prefilter = _build_prefilter(pattern.pattern for pattern in denylist)
+    # one tuple fetch per match instead of walking the metadata dicts in the hot loop
+    fast_meta = {
+        compiled: tuple((meta["Name"], meta["Check_ID"]) for meta in metadata)
+        for compiled, metadata in regex_to_metadata.items()
+    }
+    return _CompiledDetectors(
+        denylist=denylist,
+        regex_to_metadata=regex_to_metadata,
+        patterns=tuple(patterns),
+        combined=combined,
+        gated_patterns=gated_patterns,
+        ungated_patterns=ungated_patterns,
+        hs_db=hs_db,
+        prefilter=prefilter,
+        fast_meta=fast_meta,
+    )
+
 
 def load_detectors() -> list[dict[str, Any]]:
     detectors: List[dict[str, Any]] = []
@@ -40,39 +363,85 @@ def modify_secrets_policy_to_detectors(policies_list: List[dict[str, Any]]) -> L
     return secrets_list
 
 
-def transforms_policies_to_detectors_list(custom_secrets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    custom_detectors: List[Dict[str, Any]] = []
+def iter_policies_as_detectors(custom_secrets: Iterable[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
+    """Lazily transforms policies into detector dicts, one policy at a time.
+
+    Accepting any iterable keeps the memory working set bounded by a single policy, so a streaming
+    source (e.g. ijson over a very large policies payload) can be piped straight into the detector
+    builder without materializing the whole policy list first.
+    """
     for secret_policy in custom_secrets:
         not_parsed = True
         code = secret_policy['code']
         if code:
-            code_dict = yaml.safe_load(secret_policy['code'])
+            try:
+                # policy code blocks are frequently plain JSON, which parses an order of magnitude
+                # faster than going through the YAML loader
+                code_dict = json.loads(code)
+            except Exception:
+                code_dict = yaml.load(code, Loader=_YAML_LOADER)
             if 'definition' in code_dict:
                 if 'value' in code_dict['definition']:
                     not_parsed = False
                     for regex in code_dict['definition']['value']:
                         check_id = secret_policy['checkovCheckId'] if secret_policy['checkovCheckId'] else \
                             secret_policy['incidentId']
-                        custom_detectors.append({'Name': secret_policy['title'],
-                                                 'Check_ID': check_id,
-                                                 'Regex': regex})
+                        # interning collapses the many repeated Name/Check_ID/Regex strings of large
+                        # customer detector sets into single objects, shrinking RSS and letting
+                        # later dict lookups short-circuit on pointer equality
+                        yield {'Name': sys.intern(secret_policy['title']),
+                               'Check_ID': sys.intern(check_id),
+                               'Regex': sys.intern(regex)}
         if not_parsed:
             logging.info(f"policy : {secret_policy} could not be parsed")
-    return custom_detectors
+
+
+def transforms_policies_to_detectors_list(custom_secrets: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return list(iter_policies_as_detectors(custom_secrets))
 
 
 class CustomRegexDetector(RegexBasedDetector):
     secret_type = "Regex Detector"  # noqa: CCE003 # nosec
+    # annotated as a set for API compatibility, but at runtime instances hold an immutable tuple
     denylist: Set[Pattern[str]] = set()  # noqa: CCE003
 
     def __init__(self) -> None:
-        self.regex_to_metadata: dict[str, dict[str, Any]] = dict()
-        self.denylist = set()
-        detectors = load_detectors()
+        self.regex_to_metadata: dict[Pattern[str], list[dict[str, Any]]] = {}
+        self.denylist: Tuple[Pattern[str], ...] = ()  # type:ignore[assignment]
+        self._combined: Optional[Pattern[str]] = None
+        self._gated_patterns: Tuple[Pattern[str], ...] = ()
+        self._ungated_patterns: Tuple[Pattern[str], ...] = ()
+        self._patterns: Tuple[Pattern[str], ...] = ()
+        self._hs_db: Optional[Any] = None
+        self._hs_scratch_holder = threading.local()
+        self._prefilter: Optional[Pattern[str]] = None
+        self._fast_meta: Dict[Pattern[str], Tuple[Tuple[str, str], ...]] = {}
+        # the inherited verify is a no-op returning UNVERIFIED, so its inspect-based dispatch can be
+        # skipped per match unless a subclass actually overrides it
+        self._has_custom_verify = type(self).verify is not RegexBasedDetector.verify
+        self._loaded = False
+        self._load_lock = threading.Lock()
 
-        for detector in detectors:
-            self.denylist.add(re.compile(r'{}'.format(detector["Regex"])))
-            self.regex_to_metadata[detector["Regex"]] = detector
+    def _ensure_loaded(self) -> None:
+        """Loads and compiles the detectors on first use, so construction stays free of I/O and parsing."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            detectors = load_detectors()
+            detectors_key = tuple((detector["Regex"], detector["Name"], detector["Check_ID"]) for detector in detectors)
+            compiled = _build_compiled(detectors_key)
+            self.regex_to_metadata = compiled.regex_to_metadata
+            self.denylist = compiled.denylist  # type:ignore[assignment]
+            self._combined = compiled.combined
+            self._gated_patterns = compiled.gated_patterns
+            self._ungated_patterns = compiled.ungated_patterns
+            self._patterns = compiled.patterns
+            self._hs_db = compiled.hs_db
+            self._prefilter = compiled.prefilter
+            self._fast_meta = compiled.fast_meta
+            self._loaded = True
 
     def analyze_line(
             self,
@@ -84,27 +453,138 @@ class CustomRegexDetector(RegexBasedDetector):
             **kwargs: Any
     ) -> Set[PotentialSecret]:
         """This examines a line and finds all possible secret values in it."""
-        output: Set[PotentialSecret] = set()
-        for match, regex in self.analyze_string(line, **kwargs):
-            try:
-                verified_result = call_function_with_arguments(self.verify, secret=match, context=context)
-                is_verified = True if verified_result == VerifiedResult.VERIFIED_TRUE else False
-            except Exception:
-                is_verified = False
+        self._ensure_loaded()
+        candidates = ((secret, regex, line_number) for secret, regex, _ in self._scan_buffer(line))
+        return self._build_output(filename, candidates, context)
+
+    def analyze_file(self, filename: str, text: str) -> Set[PotentialSecret]:
+        """This examines a whole file content in one pass and finds all possible secret values in it.
+
+        Running the scan once over the full buffer amortizes the per-line regex engine invocations;
+        line numbers are derived from the match offsets via a precomputed line-start table.
+        """
+        self._ensure_loaded()
+        line_starts = [0]
+        position = 0
+        for line in text.splitlines(keepends=True):
+            position += len(line)
+            line_starts.append(position)
+        candidates = ((secret, regex, bisect_right(line_starts, offset))
+                      for secret, regex, offset in self._scan_buffer(text))
+        return self._build_output(filename, candidates, None)
+
+    def analyze_files(
+            self, items: Iterable[Tuple[str, str]]
+    ) -> Generator[Tuple[str, Set[PotentialSecret]], None, None]:
+        """This examines multiple (filename, content) pairs, scanning the files across a thread pool.
 
-            ps = PotentialSecret(type=self.regex_to_metadata[regex.pattern]["Name"], filename=filename, secret=match,
-                                 line_number=line_number, is_verified=is_verified)
-            ps.check_id = self.regex_to_metadata[regex.pattern]["Check_ID"]  # type:ignore[attr-defined]
-            output.add(ps)
+        Scanning is embarrassingly parallel over files; the hyperscan and re2 scan calls release the
+        GIL while matching, so the pool scales with cores when those engines are active, and on
+        free-threaded CPython builds the pure-Python path benefits as well.
+        """
+        self._ensure_loaded()
+        items = list(items)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            yield from zip(
+                (filename for filename, _ in items),
+                executor.map(self._scan_one_file, items),
+            )
 
-        return output
+    def _scan_one_file(self, item: Tuple[str, str]) -> Set[PotentialSecret]:
+        filename, text = item
+        return self.analyze_file(filename, text)
+
+    def _get_hs_scratch(self) -> Any:
+        # hyperscan scan calls release the GIL, so pool threads racing on one shared scratch space
+        # would corrupt it; every thread lazily allocates its own from the shared database
+        scratch = getattr(self._hs_scratch_holder, "scratch", None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(self._hs_db)
+            self._hs_scratch_holder.scratch = scratch
+        return scratch
+
+    def _build_output(
+            self,
+            filename: str,
+            candidates: Generator[Tuple[str, Pattern[str], int], None, None],
+            context: Optional[CodeSnippet],
+    ) -> Set[PotentialSecret]:
+        # matches are collected first and the secrets built in one comprehension - the specialized
+        # comprehension opcodes beat an explicit loop with per-iteration set.add and try/except setup
+        pairs = list(candidates)
+        if not pairs:
+            return set()
+        if self._has_custom_verify:
+            verified = [self._safe_verify(match, context) for match, _, _ in pairs]
+        else:
+            verified = [False] * len(pairs)
+        fast_meta = self._fast_meta
+        return {
+            self._mk_ps(filename, name, check_id, match, line_number, is_verified)
+            for (match, regex, line_number), is_verified in zip(pairs, verified)
+            for name, check_id in fast_meta[regex]
+        }
+
+    def _safe_verify(self, match: str, context: Optional[CodeSnippet]) -> bool:
+        try:
+            verified_result = call_function_with_arguments(self.verify, secret=match, context=context)
+            return True if verified_result == VerifiedResult.VERIFIED_TRUE else False
+        except Exception:
+            return False
+
+    @staticmethod
+    def _mk_ps(filename: str, name: str, check_id: str, match: str, line_number: int, is_verified: bool) -> PotentialSecret:
+        ps = PotentialSecret(type=name, filename=filename, secret=match,
+                             line_number=line_number, is_verified=is_verified)
+        ps.check_id = check_id  # type:ignore[attr-defined]
+        return ps
 
     def analyze_string(self, string: str, **kwargs: Optional[Dict[str, Any]]) -> Generator[Tuple[str, Pattern[str]], None, None]:  # type:ignore[override]
+        for secret, regex, _ in self._scan_buffer(string):
+            yield secret, regex
+
+    def _scan_buffer(self, string: str) -> Generator[Tuple[str, Pattern[str], int], None, None]:
+        """Yields every (secret, pattern, offset) found in the given buffer, fastest available path first."""
+        self._ensure_loaded()
+        if self._prefilter is not None and self._prefilter.search(string) is None:
+            # no detector can possibly match, skip the buffer after one cheap character-class pass
+            return
+
+        if self._hs_db is not None:
+            matched_ids: Set[int] = set()
+            self._hs_db.scan(
+                string.encode(),
+                match_event_handler=lambda id_, start, end, flags, ctx: matched_ids.add(id_),
+                scratch=self._get_hs_scratch(),
+            )
+            for pattern_id in sorted(matched_ids):
+                yield from self._finditer(self._patterns[pattern_id], string)
+            return
+
+        if self._combined is not None:
+            # one engine pass decides whether the buffer holds any candidate; only then is each
+            # gated pattern's own finditer run, so overlapping findings of different detectors are
+            # kept; patterns excluded from the gate (backreferences) are always scanned
+            if self._combined.search(string) is not None:
+                for regex in self._gated_patterns:
+                    yield from self._finditer(regex, string)
+            for regex in self._ungated_patterns:
+                yield from self._finditer(regex, string)
+            return
+
         for regex in self.denylist:
-            for match in regex.findall(string):
-                if isinstance(match, tuple):
-                    for submatch in filter(bool, match):
-                        # It might make sense to paste break after yielding
-                        yield submatch, regex
-                else:
-                    yield match, regex
+            yield from self._finditer(regex, string)
+
+    @staticmethod
+    def _finditer(regex: Pattern[str], string: str) -> Generator[Tuple[str, Pattern[str], int], None, None]:
+        # the group-dispatch branch is taken once per pattern instead of once per match; patterns
+        # with capture groups keep the upstream behaviour of recording each submatch as the secret
+        if regex.groups:
+            for match in regex.finditer(string):
+                for group_number in range(1, regex.groups + 1):
+                    secret = match.group(group_number)
+                    if secret:
+                        yield secret, regex, match.start(group_number)
+        else:
+            for match in regex.finditer(string):
+                yield match.group(), regex, match.start()
@@ -134,6 +134,132 @@ class TestCustomRegexDetector(unittest.TestCase):
         ]}
 
         detector_obj = CustomRegexDetector()
+        # scanning a line forces the lazy detector loading; the policy code above has no
+        # definition.value, so no detectors may come out of it
+        secrets = detector_obj.analyze_line(filename="main.tf", line="instance_type = \"t3.micro\"", line_number=1)
 
+        assert len(secrets) == 0
         assert len(detector_obj.denylist) == 0
         assert len(detector_obj.regex_to_metadata) == 0
+
+    @staticmethod
+    def _set_policies(*policies: Dict[str, Any]) -> None:
+        bc_integration.customer_run_config_response = {"secretsPolicies": [
+            {
+                "incidentId": f"test_AWS_{index}",
+                "title": policy["title"],
+                "checkovCheckId": policy["check_id"],
+                "code": "definition:\n value:\n" + "".join(f"  - '{regex}'\n" for regex in policy["regexes"])
+            }
+            for index, policy in enumerate(policies)
+        ]}
+
+    def test_overlapping_detectors_are_both_reported(self) -> None:
+        self._set_policies(
+            {"title": "password assignment", "check_id": "CKV_SECRET_TEST_PW", "regexes": [r"password=\w+"]},
+            {"title": "secret value", "check_id": "CKV_SECRET_TEST_VAL", "regexes": [r"\w+=secret"]},
+        )
+
+        detector_obj = CustomRegexDetector()
+        secrets = detector_obj.analyze_line(filename="main.tf", line="password=secret", line_number=1)
+
+        assert {secret.check_id for secret in secrets} == {"CKV_SECRET_TEST_PW", "CKV_SECRET_TEST_VAL"}
+
+    def test_same_position_prefix_detectors_are_both_reported(self) -> None:
+        self._set_policies(
+            {"title": "short key", "check_id": "CKV_SECRET_TEST_SHORT", "regexes": [r"AKIA[0-9A-Z]{8}"]},
+            {"title": "long key", "check_id": "CKV_SECRET_TEST_LONG", "regexes": [r"AKIA[0-9A-Z]{16}"]},
+        )
+
+        detector_obj = CustomRegexDetector()
+        secrets = detector_obj.analyze_line(filename="main.tf", line="key = AKIA0123456789ABCDEF", line_number=1)
+
+        assert {secret.check_id for secret in secrets} == {"CKV_SECRET_TEST_SHORT", "CKV_SECRET_TEST_LONG"}
+
+    def test_backreference_pattern_matches(self) -> None:
+        self._set_policies(
+            {"title": "repeated word", "check_id": "CKV_SECRET_TEST_REF", "regexes": [r"(\w+)-\1"]},
+            {"title": "token", "check_id": "CKV_SECRET_TEST_TOKEN", "regexes": [r"ghp_[a-z]{5}"]},
+        )
+
+        detector_obj = CustomRegexDetector()
+        secrets = detector_obj.analyze_line(filename="main.tf", line="value abc-abc end", line_number=1)
+
+        assert {secret.check_id for secret in secrets} == {"CKV_SECRET_TEST_REF"}
+
+    def test_capture_group_submatch_is_the_recorded_secret(self) -> None:
+        from detect_secrets.core.potential_secret import PotentialSecret
+
+        self._set_policies(
+            {"title": "token assignment", "check_id": "CKV_SECRET_TEST_TOK", "regexes": [r"token\s*=\s*(\S+)"]},
+        )
+
+        detector_obj = CustomRegexDetector()
+        secrets = detector_obj.analyze_line(filename="main.tf", line="token = abc123", line_number=1)
+        expected = PotentialSecret(type="token assignment", filename="main.tf", secret="abc123", line_number=1)
+
+        assert len(secrets) == 1
+        assert next(iter(secrets)).secret_hash == expected.secret_hash
+
+    def test_analyze_file_maps_offsets_to_line_numbers(self) -> None:
+        self._set_policies(
+            {"title": "AWS access key", "check_id": "CKV_SECRET_TEST_AWS", "regexes": [r"AKIA[0-9A-Z]{16}"]},
+            {"title": "token", "check_id": "CKV_SECRET_TEST_TOKEN", "regexes": [r"ghp_[a-z0-9]{10}"]},
+        )
+
+        detector_obj = CustomRegexDetector()
+        text = "resource \"aws_instance\" \"this\" {\n" \
+               "  key = AKIA0123456789ABCDEF\n" \
+               "}\n" \
+               "token = ghp_abcdef1234\n"
+        secrets = detector_obj.analyze_file("main.tf", text)
+
+        assert {(secret.check_id, secret.line_number) for secret in secrets} == {
+            ("CKV_SECRET_TEST_AWS", 2),
+            ("CKV_SECRET_TEST_TOKEN", 4),
+        }
+
+    def test_duplicate_regex_is_attributed_to_every_policy(self) -> None:
+        self._set_policies(
+            {"title": "first policy", "check_id": "CKV_SECRET_TEST_FIRST", "regexes": [r"AKIA[0-9A-Z]{16}"]},
+            {"title": "second policy", "check_id": "CKV_SECRET_TEST_SECOND", "regexes": [r"AKIA[0-9A-Z]{16}"]},
+        )
+
+        detector_obj = CustomRegexDetector()
+        secrets = detector_obj.analyze_line(filename="main.tf", line="key = AKIA0123456789ABCDEF", line_number=1)
+
+        assert {(secret.type, secret.check_id) for secret in secrets} == {
+            ("first policy", "CKV_SECRET_TEST_FIRST"),
+            ("second policy", "CKV_SECRET_TEST_SECOND"),
+        }
+
+    def test_prefilter_skips_and_passes_lines(self) -> None:
+        self._set_policies(
+            {"title": "AWS access key", "check_id": "CKV_SECRET_TEST_AWS", "regexes": [r"AKIA[0-9A-Z]{16}"]},
+        )
+
+        detector_obj = CustomRegexDetector()
+        missed = detector_obj.analyze_line(filename="main.tf", line="nothing to see here", line_number=1)
+        found = detector_obj.analyze_line(filename="main.tf", line="key = AKIA0123456789ABCDEF", line_number=1)
+
+        assert detector_obj._prefilter is not None
+        assert detector_obj._prefilter.search("nothing to see here") is None
+        assert len(missed) == 0
+        assert len(found) == 1
+
+    def test_verify_is_skipped_without_custom_verify(self) -> None:
+        bc_integration.customer_run_config_response = {"secretsPolicies": [
+            {
+                "incidentId": "test_AWS_1234567890123",
+                "title": "AWS access key",
+                "checkovCheckId": "CKV_SECRET_TEST_1",
+                "code": "definition:\n value:\n  - \"AKIA[0-9A-Z]{16}\"\n"
+            }
+        ]}
+
+        detector_obj = CustomRegexDetector()
+        secrets = detector_obj.analyze_line(filename="main.tf", line="key = AKIA0123456789ABCDEF", line_number=1)
+
+        assert detector_obj._has_custom_verify is False
+        assert len(secrets) == 1
+        assert next(iter(secrets)).is_verified is False